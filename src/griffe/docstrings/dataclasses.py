@@ -11,6 +11,27 @@ if TYPE_CHECKING:
     from griffe.dataclasses import Expression, Name
 
 
+# Warnings -----------------------------------------------
+class DocstringWarningCode(enum.Enum):
+    """The possible docstring parsing warning codes.
+
+    Parsers emit these alongside their warning messages so that consumers
+    can match warnings without parsing the message text.
+    """
+
+    invalid_directive = "invalid directive"
+    invalid_field_directive = "invalid field directive"
+    invalid_exception_directive = "invalid exception directive"
+    no_parameter_name = "no parameter name"
+    no_attribute_name = "no attribute name"
+    no_matching_parameter = "no matching parameter"
+    no_return_annotation = "no return annotation"
+    duplicate_parameter = "duplicate parameter"
+    duplicate_parameter_information = "duplicate parameter information"
+    duplicate_attribute = "duplicate attribute"
+    duplicate_attribute_information = "duplicate attribute information"
+
+
 # Elements -----------------------------------------------
 class DocstringElement:
     """This base class represents annotated, nameless elements.
@@ -30,6 +51,22 @@ class DocstringElement:
         self.description: str = description
         self.annotation: str | Name | Expression | None = annotation
 
+    def __eq__(self, other: Any) -> bool:
+        """Check if this element is equal to another one.
+
+        Elements compare structurally: two elements are equal when they are
+        of the same class and serialize to the same data.
+
+        Parameters:
+            other: The other element.
+
+        Returns:
+            True if the elements are equal, False otherwise.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
     def as_dict(self, **kwargs: Any) -> dict[str, Any]:
         """Return this element's data as a dictionary.
 
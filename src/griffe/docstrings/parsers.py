@@ -1,14 +1,13 @@
-"""This module imports all the defined parsers."""
+"""This module exposes all the defined parsers."""
 
 from __future__ import annotations
 
 import enum
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable
 
 from griffe.docstrings.dataclasses import DocstringSection, DocstringSectionText
-from griffe.docstrings.google import parse as parse_google
-from griffe.docstrings.numpy import parse as parse_numpy
-from griffe.docstrings.sphinx import parse as parse_sphinx
 
 if TYPE_CHECKING:
     from griffe.dataclasses import Docstring
@@ -29,11 +28,11 @@ class Parser(enum.Enum):
     numpy = "numpy"
 
 
-parsers = {
-    Parser.google: parse_google,
-    Parser.sphinx: parse_sphinx,
-    Parser.numpy: parse_numpy,
-}
+@lru_cache(maxsize=None)
+def _get_parser(parser: Parser) -> Callable[..., list[DocstringSection]]:
+    # import the parser modules lazily: loading this module only requires
+    # the Parser enumeration, not the whole parsing machinery
+    return import_module(f"griffe.docstrings.{parser.value}").parse
 
 
 def parse(docstring: Docstring, parser: Parser | None, **options: Any) -> list[DocstringSection]:
@@ -48,5 +47,5 @@ def parse(docstring: Docstring, parser: Parser | None, **options: Any) -> list[D
         A list of docstring sections.
     """
     if parser:
-        return parsers[parser](docstring, **options)  # type: ignore[operator]
+        return _get_parser(parser)(docstring, **options)
     return [DocstringSectionText(docstring.value)]
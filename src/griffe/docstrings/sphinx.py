@@ -7,8 +7,11 @@ See https://github.com/mkdocstrings/pytkdocs/pull/71.
 
 from __future__ import annotations
 
+import re
 from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice, takewhile
 from typing import TYPE_CHECKING, Any, Callable, FrozenSet
 
 from griffe.docstrings.dataclasses import (
@@ -22,6 +25,7 @@ from griffe.docstrings.dataclasses import (
     DocstringSectionRaises,
     DocstringSectionReturns,
     DocstringSectionText,
+    DocstringWarningCode,
 )
 from griffe.docstrings.utils import warning
 from griffe.expressions import Expression, Name
@@ -48,17 +52,6 @@ class FieldType:
     names: FrozenSet[str]
     reader: Callable[[Docstring, int, ParsedValues], int]
 
-    def matches(self, line: str) -> bool:
-        """Check if a line matches the field type.
-
-        Parameters:
-            line: Line to check against
-
-        Returns:
-            True if the line matches the field type, False otherwise.
-        """
-        return any(line.startswith(f":{name}") for name in self.names)
-
 
 @dataclass
 class ParsedDirective:
@@ -95,6 +88,11 @@ def parse(docstring: Docstring, **options: Any) -> list[DocstringSection]:
     Returns:
         A list of docstring sections.
     """
+    # the docstring value is cleaned up at instantiation: when it's empty
+    # there's nothing to scan, return the single empty text section directly
+    if not docstring.value:
+        return [DocstringSectionText("")]
+
     parsed_values = ParsedValues()
 
     lines = docstring.lines
@@ -102,11 +100,14 @@ def parse(docstring: Docstring, **options: Any) -> list[DocstringSection]:
 
     while curr_line_index < len(lines):
         line = lines[curr_line_index]
-        for field_type in field_types:
-            if field_type.matches(line):
-                # https://github.com/python/mypy/issues/5485
-                curr_line_index = field_type.reader(docstring, curr_line_index, parsed_values)  # type: ignore[misc,operator]
-                break
+        # most lines are plain description text: skip the pattern entirely
+        # unless the line can actually start a field directive
+        match = _fields_pattern.match(line) if line.startswith(":") else None
+        if match:
+            # the index of the matched group tells which field type matched first
+            # https://github.com/python/mypy/issues/5485
+            reader = field_types[match.lastindex - 1].reader  # type: ignore[operator]
+            curr_line_index = reader(docstring, curr_line_index, parsed_values)  # type: ignore[misc,operator]
         else:
             parsed_values.description.append(line)
 
@@ -128,11 +129,16 @@ def _read_parameter(docstring: Docstring, offset: int, parsed_values: ParsedValu
         directive_type = parsed_directive.directive_parts[1]
         name = parsed_directive.directive_parts[2]
     else:
-        _warn(docstring, 0, f"Failed to parse field directive from '{parsed_directive.line}'")
+        _warn(
+            docstring,
+            0,
+            f"Failed to parse field directive from '{parsed_directive.line}'",
+            DocstringWarningCode.invalid_field_directive,
+        )
         return parsed_directive.next_index
 
     if name in parsed_values.parameters:
-        _warn(docstring, 0, f"Duplicate parameter entry for '{name}'")
+        _warn(docstring, 0, f"Duplicate parameter entry for '{name}'", DocstringWarningCode.duplicate_parameter)
         return parsed_directive.next_index
 
     annotation = _determine_param_annotation(docstring, name, directive_type, parsed_values)
@@ -173,13 +179,18 @@ def _determine_param_annotation(
         annotation = directive_type
 
     if directive_type is not None and parsed_param_type is not None:
-        _warn(docstring, 0, f"Duplicate parameter information for '{name}'")
+        _warn(
+            docstring,
+            0,
+            f"Duplicate parameter information for '{name}'",
+            DocstringWarningCode.duplicate_parameter_information,
+        )
 
     if annotation is None:
         try:
             annotation = docstring.parent.parameters[name.lstrip()].annotation  # type: ignore[union-attr]
         except (AttributeError, KeyError):
-            _warn(docstring, 0, f"No matching parameter for '{name}'")
+            _warn(docstring, 0, f"No matching parameter for '{name}'", DocstringWarningCode.no_matching_parameter)
 
     return annotation
 
@@ -193,7 +204,12 @@ def _read_parameter_type(docstring: Docstring, offset: int, parsed_values: Parse
     if len(parsed_directive.directive_parts) == 2:
         param_name = parsed_directive.directive_parts[1]
     else:
-        _warn(docstring, 0, f"Failed to get parameter name from '{parsed_directive.line}'")
+        _warn(
+            docstring,
+            0,
+            f"Failed to get parameter name from '{parsed_directive.line}'",
+            DocstringWarningCode.no_parameter_name,
+        )
         return parsed_directive.next_index
 
     parsed_values.param_types[param_name] = param_type
@@ -202,7 +218,12 @@ def _read_parameter_type(docstring: Docstring, offset: int, parsed_values: Parse
         if param.annotation is None:
             param.annotation = param_type
         else:
-            _warn(docstring, 0, f"Duplicate parameter information for '{param_name}'")
+            _warn(
+                docstring,
+                0,
+                f"Duplicate parameter information for '{param_name}'",
+                DocstringWarningCode.duplicate_parameter_information,
+            )
     return parsed_directive.next_index
 
 
@@ -214,7 +235,12 @@ def _read_attribute(docstring: Docstring, offset: int, parsed_values: ParsedValu
     if len(parsed_directive.directive_parts) == 2:
         name = parsed_directive.directive_parts[1]
     else:
-        _warn(docstring, 0, f"Failed to parse field directive from '{parsed_directive.line}'")
+        _warn(
+            docstring,
+            0,
+            f"Failed to parse field directive from '{parsed_directive.line}'",
+            DocstringWarningCode.invalid_field_directive,
+        )
         return parsed_directive.next_index
 
     annotation: str | Name | Expression | None = None
@@ -232,7 +258,7 @@ def _read_attribute(docstring: Docstring, offset: int, parsed_values: ParsedValu
         with suppress(AttributeError, KeyError):
             annotation = docstring.parent.attributes[name].annotation  # type: ignore[union-attr]
     if name in parsed_values.attributes:
-        _warn(docstring, 0, f"Duplicate attribute entry for '{name}'")
+        _warn(docstring, 0, f"Duplicate attribute entry for '{name}'", DocstringWarningCode.duplicate_attribute)
     else:
         parsed_values.attributes[name] = DocstringAttribute(
             name=name,
@@ -252,7 +278,12 @@ def _read_attribute_type(docstring: Docstring, offset: int, parsed_values: Parse
     if len(parsed_directive.directive_parts) == 2:
         attribute_name = parsed_directive.directive_parts[1]
     else:
-        _warn(docstring, 0, f"Failed to get attribute name from '{parsed_directive.line}'")
+        _warn(
+            docstring,
+            0,
+            f"Failed to get attribute name from '{parsed_directive.line}'",
+            DocstringWarningCode.no_attribute_name,
+        )
         return parsed_directive.next_index
 
     parsed_values.attribute_types[attribute_name] = attribute_type
@@ -261,7 +292,12 @@ def _read_attribute_type(docstring: Docstring, offset: int, parsed_values: Parse
         if attribute.annotation is None:
             attribute.annotation = attribute_type
         else:
-            _warn(docstring, 0, f"Duplicate attribute information for '{attribute_name}'")
+            _warn(
+                docstring,
+                0,
+                f"Duplicate attribute information for '{attribute_name}'",
+                DocstringWarningCode.duplicate_attribute_information,
+            )
     return parsed_directive.next_index
 
 
@@ -274,7 +310,12 @@ def _read_exception(docstring: Docstring, offset: int, parsed_values: ParsedValu
         ex_type = parsed_directive.directive_parts[1]
         parsed_values.exceptions.append(DocstringRaise(annotation=ex_type, description=parsed_directive.value))
     else:
-        _warn(docstring, 0, f"Failed to parse exception directive from '{parsed_directive.line}'")
+        _warn(
+            docstring,
+            0,
+            f"Failed to parse exception directive from '{parsed_directive.line}'",
+            DocstringWarningCode.invalid_exception_directive,
+        )
 
     return parsed_directive.next_index
 
@@ -295,7 +336,12 @@ def _read_return(docstring: Docstring, offset: int, parsed_values: ParsedValues)
         try:
             annotation = docstring.parent.returns  # type: ignore[union-attr]
         except AttributeError:
-            _warn(docstring, 0, f"No return type or annotation at '{parsed_directive.line}'")
+            _warn(
+                docstring,
+                0,
+                f"No return type or annotation at '{parsed_directive.line}'",
+                DocstringWarningCode.no_return_annotation,
+            )
             annotation = None
 
     # TODO: maybe support names
@@ -334,31 +380,34 @@ def _parsed_values_to_sections(parsed_values: ParsedValues) -> list[DocstringSec
     return result
 
 
+_directive_pattern = re.compile(r":([^:]*):(.*)")
+
+
 def _parse_directive(docstring: Docstring, offset: int) -> ParsedDirective:
     line, next_index = _consolidate_continuation_lines(docstring.lines, offset)
-    try:
-        _, directive, value = line.split(":", 2)
-    except ValueError:
-        _warn(docstring, 0, f"Failed to get ':directive: value' pair from '{line}'")
+    match = _directive_pattern.match(line)
+    if not match:
+        _warn(
+            docstring,
+            0,
+            f"Failed to get ':directive: value' pair from '{line}'",
+            DocstringWarningCode.invalid_directive,
+        )
         return ParsedDirective(line, next_index, [], "", invalid=True)
 
-    value = value.strip()
-    return ParsedDirective(line, next_index, directive.split(" "), value)
+    directive, value = match.groups()
+    return ParsedDirective(line, next_index, directive.split(" "), value.strip())
 
 
 def _consolidate_continuation_lines(lines: list[str], offset: int) -> tuple[str, int]:
-    curr_line_index = offset
-    block = [lines[curr_line_index].lstrip()]
-
-    # start processing after first item
-    curr_line_index += 1
-    while curr_line_index < len(lines) and not lines[curr_line_index].startswith(":"):
-        block.append(lines[curr_line_index].lstrip())
-        curr_line_index += 1
-
-    return " ".join(block).rstrip("\n"), curr_line_index - 1
+    # consume the continuation lines following the directive line in C-level loops
+    block = [lines[offset].lstrip()]
+    continuations = takewhile(lambda line: not line.startswith(":"), islice(lines, offset + 1, None))
+    block.extend(line.lstrip() for line in continuations)
+    return " ".join(block).rstrip("\n"), offset + len(block) - 1
 
 
+@lru_cache(maxsize=1024)
 def _consolidate_descriptive_type(descriptive_type: str) -> str:
     return descriptive_type.replace(" or ", " | ")
 
@@ -390,3 +439,8 @@ field_types = [
     FieldType(RETURN_NAMES, _read_return),
     FieldType(RETURN_TYPE_NAMES, _read_return_type),
 ]
+
+# All the field type patterns combined into one alternation,
+# so each line is scanned once instead of once per field type.
+# The alternatives keep the order of `field_types`.
+_fields_pattern = re.compile("|".join(f"(:(?:{'|'.join(sorted(field_type.names))}))" for field_type in field_types))
@@ -7,6 +7,7 @@ from contextlib import suppress
 from typing import TYPE_CHECKING, Callable
 
 from griffe.agents.nodes import get_annotation
+from griffe.docstrings.dataclasses import DocstringWarningCode
 from griffe.expressions import Expression, Name
 from griffe.logger import get_logger
 
@@ -14,7 +15,7 @@ if TYPE_CHECKING:
     from griffe.dataclasses import Docstring
 
 
-def warning(name: str) -> Callable[[Docstring, int, str], None]:
+def warning(name: str) -> Callable[..., None]:
     """Create and return a warn function.
 
     Parameters:
@@ -29,10 +30,11 @@ def warning(name: str) -> Callable[[Docstring, int, str], None]:
         docstring (Docstring): The docstring object.
         offset (int): The offset in the docstring lines.
         message (str): The message to log.
+        code (DocstringWarningCode | None): An optional code identifying the warning.
     """
     logger = get_logger(name)
 
-    def warn(docstring: Docstring, offset: int, message: str) -> None:  # noqa: WPS430
+    def warn(docstring: Docstring, offset: int, message: str, code: DocstringWarningCode | None = None) -> None:  # noqa: WPS430
         try:
             prefix = docstring.parent.relative_filepath  # type: ignore[union-attr]
         except AttributeError:
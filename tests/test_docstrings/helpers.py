@@ -2,24 +2,81 @@
 
 from __future__ import annotations
 
+import inspect
+from functools import lru_cache
 from typing import Any, Callable, List, Tuple, Union
 
-from griffe.dataclasses import Attribute, Class, Docstring, Function, Module
-from griffe.docstrings.dataclasses import DocstringAttribute, DocstringElement, DocstringParameter, DocstringSection
+from griffe.dataclasses import Attribute, Class, Docstring, Function, Module, Parameter, Parameters
+from griffe.docstrings.dataclasses import (
+    DocstringAttribute,
+    DocstringElement,
+    DocstringParameter,
+    DocstringRaise,
+    DocstringReturn,
+    DocstringSection,
+    DocstringWarningCode,
+)
 
 ParentType = Union[Module, Class, Function, Attribute, None]
-ParseResultType = Tuple[List[DocstringSection], List[str]]
+WarningType = Union[str, DocstringWarningCode]
+ParseResultType = Tuple[List[DocstringSection], List[WarningType]]
+
+cleandoc = lru_cache(maxsize=256)(inspect.cleandoc)
+"""Cached version of `inspect.cleandoc`, as tests clean the same docstrings repeatedly."""
+
+# Cached factories for expected values: tests build the same elements with the same
+# arguments dozens of times, and assertions only ever read them.
+cached_parameter = lru_cache(maxsize=None)(DocstringParameter)
+cached_attribute = lru_cache(maxsize=None)(DocstringAttribute)
+cached_return = lru_cache(maxsize=None)(DocstringReturn)
+cached_raise = lru_cache(maxsize=None)(DocstringRaise)
+
+
+@lru_cache(maxsize=None)
+def _function_with_parameter(annotation: str | None, default: str | None) -> Function:
+    return Function("func", parameters=Parameters(Parameter("foo", annotation=annotation, kind=None, default=default)))
+
+
+def function_with_parameter(annotation: str | None = None, default: str | None = None) -> Function:
+    """Return a function with a single `foo` parameter, cached per annotation and default.
+
+    The function's docstring is reset so tests can attach their own.
+
+    Parameters:
+        annotation: The parameter annotation.
+        default: The parameter default value, as a string.
+
+    Returns:
+        The function object.
+    """
+    function = _function_with_parameter(annotation, default)
+    function.docstring = None
+    return function
 
 
 def parser(parser_module) -> Callable[[str, ParentType, Any], ParseResultType]:
     """Wrap a parser to help testing.
 
+    The wrapped function caches its results: parsing is deterministic for
+    a given docstring, parent object and options, so parametrized tests
+    and fixture-shared parents reuse the parsed sections and warnings.
+
     Parameters:
         parser_module: The parser module containing a `parse` function.
 
     Returns:
         The wrapped function.
     """
+    cache: dict[tuple, tuple] = {}
+
+    # install the warning sink once: it records the warning code when the parser
+    # provides one, the message otherwise, into a buffer cleared before each parse
+    warnings: list[WarningType] = []
+    parser_module._warn = (  # noqa: WPS437
+        lambda _docstring, _offset, message, code=None, _append=warnings.append: _append(
+            code if code is not None else message
+        )
+    )
 
     def parse(docstring: str, parent: ParentType = None, **parser_opts: Any) -> ParseResultType:  # noqa: WPS430
         """Parse a doctring.
@@ -32,15 +89,21 @@ def parser(parser_module) -> Callable[[str, ParentType, Any], ParseResultType]:
         Returns:
             The parsed sections, and warnings.
         """
+        key = (docstring, id(parent), tuple(sorted(parser_opts.items())))
+        if key in cache:
+            _, cached_sections, cached_warnings = cache[key]
+            return list(cached_sections), list(cached_warnings)
         docstring_object = Docstring(docstring, lineno=1, endlineno=None)
-        docstring_object.endlineno = len(docstring_object.lines) + 1
+        # count newlines directly instead of materializing the cached lines early
+        docstring_object.endlineno = docstring_object.value.count("\n") + 2
         if parent is not None:
             docstring_object.parent = parent
             parent.docstring = docstring_object
-        warnings = []
-        parser_module._warn = lambda _docstring, _offset, message: warnings.append(message)  # noqa: WPS437
+        warnings.clear()
         sections = parser_module.parse(docstring_object, **parser_opts)
-        return sections, warnings
+        # the parent is kept in the entry so its id cannot be reused by another object
+        cache[key] = (parent, list(sections), list(warnings))
+        return sections, list(warnings)
 
     return parse  # type: ignore
 
@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-import inspect
-
 import pytest
 
 from griffe.dataclasses import Class, Function, Module, Parameter, Parameters
 from griffe.docstrings import google
 from griffe.docstrings.dataclasses import DocstringSectionKind
-from tests.test_docstrings.helpers import parser
+from tests.test_docstrings.helpers import cleandoc, parser
 
 parse = parser(google)
 
@@ -721,7 +719,7 @@ def test_handle_false_admonitions_correctly(docstring):
     sections, warnings = parse(docstring)
     assert len(sections) == 1
     assert sections[0].kind is DocstringSectionKind.text
-    assert len(sections[0].value.splitlines()) == len(inspect.cleandoc(docstring).splitlines())
+    assert len(sections[0].value.splitlines()) == len(cleandoc(docstring).splitlines())
     assert not warnings
 
 
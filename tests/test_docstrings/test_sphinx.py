@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
-import inspect
-
 import pytest
 
 from griffe.dataclasses import Attribute, Class, Function, Module, Parameter, Parameters
 from griffe.docstrings import sphinx
-from griffe.docstrings.dataclasses import (
-    DocstringAttribute,
-    DocstringParameter,
-    DocstringRaise,
-    DocstringReturn,
-    DocstringSectionKind,
+from griffe.docstrings.dataclasses import DocstringSectionKind, DocstringWarningCode
+from tests.test_docstrings.helpers import (
+    cached_attribute,
+    cached_parameter,
+    cached_raise,
+    cached_return,
+    cleandoc,
+    function_with_parameter,
+    parser,
 )
-from tests.test_docstrings.helpers import assert_attribute_equal, assert_element_equal, assert_parameter_equal, parser
 
 SOME_NAME = "foo"
 SOME_TEXT = "descriptive test text"
@@ -23,8 +23,260 @@ SOME_EXTRA_TEXT = "more test text"
 SOME_EXCEPTION_NAME = "SomeException"
 SOME_OTHER_EXCEPTION_NAME = "SomeOtherException"
 
+_PARAM_CONT_NO_INDENT = f"""
+        Docstring with param with continuation, no indent.
+
+        :param {SOME_NAME}: {SOME_TEXT}
+        {SOME_EXTRA_TEXT}
+        """
+
+_PARAM_CONT_INDENT = f"""
+        Docstring with param with continuation, with indent.
+
+        :param {SOME_NAME}: {SOME_TEXT}
+          {SOME_EXTRA_TEXT}
+        """
+
+_VAR_CONT_NO_INDENT = f"""
+        Docstring with param with continuation, no indent.
+
+        :var {SOME_NAME}: {SOME_TEXT}
+        {SOME_EXTRA_TEXT}
+        """
+
+_VAR_CONT_INDENT = f"""
+        Docstring with param with continuation, with indent.
+
+        :var {SOME_NAME}: {SOME_TEXT}
+          {SOME_EXTRA_TEXT}
+        """
+
+_MODULE_ATTRIBUTES = (
+    ("A", "int", "0"),
+    ("B", "str", repr("ŧ")),
+    ("C", "bool", "True"),
+    ("D", None, "3.0"),
+    ("E", None, "None"),
+)
+
+_EXPECTED_MODULE_ATTRIBUTES = [
+    cached_attribute("A", annotation="int", description="Alpha."),
+    cached_attribute("B", annotation="bytes", description="Beta."),
+    cached_attribute("C", annotation="bool", description="Gamma."),
+    cached_attribute("D", annotation=None, description="Delta."),
+    cached_attribute("E", annotation="float", description="Epsilon."),
+]
+
 parse = parser(sphinx)
 
+_TEMPLATES = {
+    "param_only": f"""
+        Docstring with line continuation.
+
+        :param foo: {SOME_TEXT}
+    """,
+    "param_other": f"""
+        Docstring with line continuation.
+
+        :param other: {SOME_TEXT}
+    """,
+    "param_typed": f"""
+        Docstring with line continuation.
+
+        :param str foo: {SOME_TEXT}
+    """,
+    "return": f"""
+        Function with only return directive
+
+        :return: {SOME_TEXT}
+    """,
+    "return_rtype": f"""
+        Function with only return & rtype directive
+
+        :return: {SOME_TEXT}
+        :rtype: str
+    """,
+    "rtype_first": f"""
+        Function with only return & rtype directive
+
+        :rtype: str
+        :return: {SOME_TEXT}
+    """,
+    "return_annotated": f"""
+        Function with return directive, rtype directive, & annotation
+
+        :return: {SOME_TEXT}
+    """,
+    "return_annotated_rtype": f"""
+        Function with return directive, rtype directive, & annotation
+
+        :return: {SOME_TEXT}
+        :rtype: str
+    """,
+    "raise_only": f"""
+        Function with only return directive
+
+        :raise SomeException: {SOME_TEXT}
+    """,
+    "raise_multiple": f"""
+        Function with only return directive
+
+        :raise SomeException: {SOME_TEXT}
+        :raise SomeOtherException: {SOME_TEXT}
+    """,
+    "blank_lines": """
+
+
+        Now text""",
+    "param_simple": f"""
+        Docstring with one line param.
+
+        :param {SOME_NAME}: {SOME_TEXT}
+        """,
+    "param_type_field": f"""
+        Docstring with line continuation.
+
+        :param foo: {SOME_TEXT}
+        :type foo: str
+    """,
+    "type_field_first": f"""
+        Docstring with line continuation.
+
+        :type foo: str
+        :param foo: {SOME_TEXT}
+    """,
+    "param_twice": f"""
+        Docstring with line continuation.
+
+        :param foo: {SOME_TEXT}
+        :param foo: {SOME_TEXT} again
+    """,
+    "param_only_initial_marker": f"""
+        Docstring with line continuation.
+
+        :param foo {SOME_TEXT}
+    """,
+    "param_wrong_part_count": f"""
+        Docstring with line continuation.
+
+        :param: {SOME_TEXT}
+    """,
+    "param_type_no_type": f"""
+        Docstring with line continuation.
+
+        :param str foo: {SOME_TEXT}
+        :type str
+    """,
+    "param_type_no_name": f"""
+        Docstring with line continuation.
+
+        :param str foo: {SOME_TEXT}
+        :type: str
+        """,
+    "class_attributes": f"""
+        Class docstring with attributes
+
+        :var foo: {SOME_TEXT}
+    """,
+    "class_attributes_typed": f"""
+        Class docstring with attributes
+
+        :vartype foo: str
+        :var foo: {SOME_TEXT}
+    """,
+    "attribute_duplicate": f"""
+        Class docstring with attributes
+
+        :var foo: {SOME_TEXT}
+        :var foo: {SOME_TEXT}
+        """,
+    "module_attributes": """
+        Let's describe some attributes.
+
+        :var A: Alpha.
+        :vartype B: bytes
+        :var B: Beta.
+        :var C: Gamma.
+        :var D: Delta.
+        :var E: Epsilon.
+        :vartype E: float
+    """,
+}
+
+# Directive-name docstrings, formatted once at import instead of in each test run.
+_PARAM_DIRECTIVE_DOCSTRINGS = {
+    directive: f"""
+        Docstring with one line param.
+
+        :{directive} {SOME_NAME}: {SOME_TEXT}
+        """
+    for directive in ("param", "parameter", "arg", "arguments", "key", "keyword")
+}
+
+_ATTRIBUTE_DIRECTIVE_DOCSTRINGS = {
+    directive: f"""
+        Docstring with one line attribute.
+
+        :{directive} {SOME_NAME}: {SOME_TEXT}
+        """
+    for directive in ("var", "ivar", "cvar")
+}
+
+_RAISE_DIRECTIVE_DOCSTRINGS = {
+    directive: f"""
+        Docstring with one line attribute.
+
+        :{directive} {SOME_EXCEPTION_NAME}: {SOME_TEXT}
+        """
+    for directive in ("raises", "raise", "except", "exception")
+}
+
+
+@pytest.fixture(scope="module")
+def templates():
+    """Return the docstring templates shared by the tests, built once at import.
+
+    Returns:
+        The docstring templates.
+    """
+    return _TEMPLATES
+
+
+@pytest.fixture(scope="module")
+def function_foo_annotated():
+    """Return a function with a single `foo` parameter annotated as `str`, built once per module.
+
+    Returns:
+        The function object.
+    """
+    return Function("func", parameters=Parameters(Parameter("foo", annotation="str", kind=None)))
+
+
+@pytest.fixture(scope="module")
+def param_directive_name(request):
+    """Return a parametrized parameter directive name, reused across the module.
+
+    Parameters:
+        request: The pytest fixture request.
+
+    Returns:
+        The directive name.
+    """
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def raise_directive_name(request):
+    """Return a parametrized raise directive name, reused across the module.
+
+    Parameters:
+        request: The pytest fixture request.
+
+    Returns:
+        The directive name.
+    """
+    return request.param
+
 
 @pytest.mark.parametrize(
     "docstring",
@@ -47,7 +299,7 @@ def test_parse__description_only_docstring__single_markdown_section(docstring):
 
     assert len(sections) == 1
     assert sections[0].kind is DocstringSectionKind.text
-    assert sections[0].value == inspect.cleandoc(docstring)
+    assert sections[0].value == cleandoc(docstring)
     assert not warnings
 
 
@@ -61,14 +313,13 @@ def test_parse__no_description__single_markdown_section():
     assert not warnings
 
 
-def test_parse__multiple_blank_lines_before_description__single_markdown_section():
-    """Parse a docstring with initial blank lines."""
-    sections, warnings = parse(
-        """
-
+def test_parse__multiple_blank_lines_before_description__single_markdown_section(templates):
+    """Parse a docstring with initial blank lines.
 
-        Now text"""
-    )
+    Parameters:
+        templates: The docstring templates.
+    """
+    sections, warnings = parse(templates["blank_lines"])
 
     assert len(sections) == 1
     assert sections[0].kind is DocstringSectionKind.text
@@ -76,18 +327,16 @@ def test_parse__multiple_blank_lines_before_description__single_markdown_section
     assert not warnings
 
 
-def test_parse__param_field__param_section():
-    """Parse a parameter section."""
-    sections, _ = parse(
-        f"""
-        Docstring with one line param.
+def test_parse__param_field__param_section(templates):
+    """Parse a parameter section.
 
-        :param {SOME_NAME}: {SOME_TEXT}
-        """
-    )
+    Parameters:
+        templates: The docstring templates.
+    """
+    sections, _ = parse(templates["param_simple"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(sections[1].value[0], DocstringParameter(SOME_NAME, description=SOME_TEXT))
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, description=SOME_TEXT)
 
 
 def test_parse__only_param_field__empty_markdown():
@@ -98,52 +347,20 @@ def test_parse__only_param_field__empty_markdown():
     assert sections[0].value == ""
 
 
-@pytest.mark.parametrize(
-    "param_directive_name",
-    [
-        "param",
-        "parameter",
-        "arg",
-        "arguments",
-        "key",
-        "keyword",
-    ],
-)
+@pytest.mark.parametrize("param_directive_name", list(_PARAM_DIRECTIVE_DOCSTRINGS), indirect=True)
 def test_parse__all_param_names__param_section(param_directive_name):
     """Parse all parameters directives.
 
     Parameters:
         param_directive_name: A parametrized directive name.
     """
-    sections, _ = parse(
-        f"""
-        Docstring with one line param.
-
-        :{param_directive_name} {SOME_NAME}: {SOME_TEXT}
-        """
-    )
+    sections, _ = parse(_PARAM_DIRECTIVE_DOCSTRINGS[param_directive_name])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(sections[1].value[0], DocstringParameter(SOME_NAME, description=SOME_TEXT))
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, description=SOME_TEXT)
 
 
-@pytest.mark.parametrize(
-    "docstring",
-    [
-        f"""
-        Docstring with param with continuation, no indent.
-
-        :param {SOME_NAME}: {SOME_TEXT}
-        {SOME_EXTRA_TEXT}
-        """,
-        f"""
-        Docstring with param with continuation, with indent.
-
-        :param {SOME_NAME}: {SOME_TEXT}
-          {SOME_EXTRA_TEXT}
-        """,
-    ],
-)
+@pytest.mark.parametrize("docstring", [_PARAM_CONT_NO_INDENT, _PARAM_CONT_INDENT])
 def test_parse__param_field_multi_line__param_section(docstring):
     """Parse multiline directives.
 
@@ -153,88 +370,72 @@ def test_parse__param_field_multi_line__param_section(docstring):
     sections, _ = parse(docstring)
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter(SOME_NAME, description=f"{SOME_TEXT} {SOME_EXTRA_TEXT}"),
-    )
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, description=f"{SOME_TEXT} {SOME_EXTRA_TEXT}")
 
 
-def test_parse__param_field_for_function__param_section_with_kind():
-    """Parse parameters."""
-    docstring = f"""
-        Docstring with line continuation.
+def test_parse__param_field_for_function__param_section_with_kind(templates):
+    """Parse parameters.
 
-        :param foo: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["param_only"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter(SOME_NAME, description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, description=SOME_TEXT)
 
 
-def test_parse__param_field_docs_type__param_section_with_type():
-    """Parse parameters with types."""
-    docstring = f"""
-        Docstring with line continuation.
+def test_parse__param_field_docs_type__param_section_with_type(templates):
+    """Parse parameters with types.
 
-        :param str foo: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["param_typed"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter(SOME_NAME, annotation="str", description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, annotation="str", description=SOME_TEXT)
 
 
-def test_parse__param_field_type_field__param_section_with_type():
-    """Parse parameters with separated types."""
-    docstring = f"""
-        Docstring with line continuation.
+def test_parse__param_field_type_field__param_section_with_type(templates):
+    """Parse parameters with separated types.
 
-        :param foo: {SOME_TEXT}
-        :type foo: str
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["param_type_field"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter(SOME_NAME, annotation="str", description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, annotation="str", description=SOME_TEXT)
 
 
-def test_parse__param_field_type_field_first__param_section_with_type():
-    """Parse parameters with separated types first."""
-    docstring = f"""
-        Docstring with line continuation.
+def test_parse__param_field_type_field_first__param_section_with_type(templates):
+    """Parse parameters with separated types first.
 
-        :type foo: str
-        :param foo: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["type_field_first"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter(SOME_NAME, annotation="str", description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, annotation="str", description=SOME_TEXT)
 
 
-@pytest.mark.parametrize("union", ["str or None", "None or str", "str or int", "str or int or float"])
-def test_parse__param_field_type_field_or_none__param_section_with_optional(union):
+@pytest.mark.parametrize(
+    "union,annotation",
+    [
+        ("str or None", "str | None"),
+        ("None or str", "None | str"),
+        ("str or int", "str | int"),
+        ("str or int or float", "str | int | float"),
+    ],
+)
+def test_parse__param_field_type_field_or_none__param_section_with_optional(union, annotation):
     """Parse parameters with separated union types.
 
     Parameters:
         union: A parametrized union type.
+        annotation: The parametrized expected annotation.
     """
     docstring = f"""
         Docstring with line continuation.
@@ -246,220 +447,140 @@ def test_parse__param_field_type_field_or_none__param_section_with_optional(unio
     sections, _ = parse(docstring)
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter(SOME_NAME, annotation=union.replace(" or ", " | "), description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, annotation=annotation, description=SOME_TEXT)
 
 
-def test_parse__param_field_annotate_type__param_section_with_type():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
+def test_parse__param_field_annotate_type__param_section_with_type(templates, function_foo_annotated):
+    """Parse a simple docstring.
 
-        :param foo: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
+        function_foo_annotated: A shared function object.
     """
-
-    sections, warnings = parse(
-        docstring,
-        parent=Function("func", parameters=Parameters(Parameter("foo", annotation="str", kind=None))),
-    )
+    sections, warnings = parse(templates["param_only"], parent=function_foo_annotated)
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter(SOME_NAME, annotation="str", description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_parameter(SOME_NAME, annotation="str", description=SOME_TEXT)
     assert not warnings
 
 
-def test_parse__param_field_no_matching_param__result_from_docstring():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
+def test_parse__param_field_no_matching_param__result_from_docstring(templates):
+    """Parse a simple docstring.
 
-        :param other: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["param_other"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter("other", description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_parameter("other", description=SOME_TEXT)
 
 
-def test_parse__param_field_with_default__result_from_docstring():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
+def test_parse__param_field_with_default__result_from_docstring(templates):
+    """Parse a simple docstring.
 
-        :param foo: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, warnings = parse(
-        docstring,
-        parent=Function("func", parameters=Parameters(Parameter("foo", kind=None, default=repr("")))),
-    )
+    sections, warnings = parse(templates["param_only"], parent=function_with_parameter(default=repr("")))
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.parameters
-    assert_parameter_equal(
-        sections[1].value[0],
-        DocstringParameter("foo", description=SOME_TEXT, value=repr("")),
-    )
+    assert sections[1].value[0] == cached_parameter("foo", description=SOME_TEXT, value=repr(""))
     assert not warnings
 
 
-def test_parse__param_field_no_matching_param__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
+@pytest.mark.parametrize(
+    "template_key,expected_code",
+    [
+        ("param_other", DocstringWarningCode.no_matching_parameter),
+        ("param_only_initial_marker", DocstringWarningCode.invalid_directive),
+        ("param_wrong_part_count", DocstringWarningCode.invalid_field_directive),
+        ("param_type_no_type", DocstringWarningCode.invalid_directive),
+        ("param_type_no_name", DocstringWarningCode.no_parameter_name),
+    ],
+    ids=["no_matching_param", "only_initial_marker", "wrong_part_count", "type_no_type", "type_no_name"],
+)
+def test_parse__invalid_param_field__error_message(templates, function_foo_annotated, template_key, expected_code):
+    """Warn on invalid parameter fields.
 
-        :param other: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
+        function_foo_annotated: A shared function object.
+        template_key: A parametrized template key.
+        expected_code: The parametrized expected warning code.
     """
+    _, warnings = parse(templates[template_key], parent=function_foo_annotated)
+    assert warnings[0] is expected_code
 
-    _, warnings = parse(docstring)
-    assert "No matching parameter for 'other'" in warnings[0]
 
+@pytest.mark.parametrize(
+    "template_key,expected_code",
+    [
+        ("param_twice", DocstringWarningCode.duplicate_parameter),
+        ("attribute_duplicate", DocstringWarningCode.duplicate_attribute),
+    ],
+    ids=["parameter", "attribute"],
+)
+def test_parse__duplicate_field__error_message(templates, template_key, expected_code):
+    """Warn on duplicate parameter and attribute directives.
 
-def test_parse__invalid_param_field_only_initial_marker__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
-
-        :param foo {SOME_TEXT}
-    """
-
-    _, warnings = parse(docstring)
-    assert "Failed to get ':directive: value' pair" in warnings[0]
-
-
-def test_parse__invalid_param_field_wrong_part_count__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
-
-        :param: {SOME_TEXT}
-    """
-
-    _, warnings = parse(docstring)
-    assert "Failed to parse field directive" in warnings[0]
-
-
-def test_parse__param_twice__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
-
-        :param foo: {SOME_TEXT}
-        :param foo: {SOME_TEXT} again
+    Parameters:
+        templates: The docstring templates.
+        template_key: A parametrized template key.
+        expected_code: The parametrized expected warning code.
     """
-
-    _, warnings = parse(
-        docstring,
-        parent=Function("func", parameters=Parameters(Parameter("foo", kind=None))),
-    )
-    assert "Duplicate parameter entry for 'foo'" in warnings[0]
+    _, warnings = parse(templates[template_key], parent=function_with_parameter())
+    assert warnings[0] is expected_code
 
 
-def test_parse__param_type_twice_doc__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
+@pytest.mark.parametrize(
+    "docstring,annotation",
+    [
+        (
+            f"""
         Docstring with line continuation.
 
         :param str foo: {SOME_TEXT}
         :type foo: str
-    """
-
-    _, warnings = parse(
-        docstring,
-        parent=Function("func", parameters=Parameters(Parameter("foo", kind=None))),
-    )
-    assert "Duplicate parameter information for 'foo'" in warnings[0]
-
-
-def test_parse__param_type_twice_type_directive_first__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
+    """,
+            None,
+        ),
+        (
+            f"""
         Docstring with line continuation.
 
         :type foo: str
         :param str foo: {SOME_TEXT}
-    """
-
-    _, warnings = parse(
-        docstring,
-        parent=Function("func", parameters=Parameters(Parameter("foo", kind=None))),
-    )
-    assert "Duplicate parameter information for 'foo'" in warnings[0]
-
-
-def test_parse__param_type_twice_annotated__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
+    """,
+            None,
+        ),
+        (
+            f"""
         Docstring with line continuation.
 
         :param str foo: {SOME_TEXT}
         :type foo: str
-    """
-
-    _, warnings = parse(
-        docstring,
-        parent=Function("func", parameters=Parameters(Parameter("foo", annotation="str", kind=None))),
-    )
-    assert "Duplicate parameter information for 'foo'" in warnings[0]
-
-
-def test_parse__param_type_no_type__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
+    """,
+            "str",
+        ),
+    ],
+    ids=["doc", "type_directive_first", "annotated"],
+)
+def test_parse__param_type_twice__error_message(docstring, annotation):
+    """Warn when the parameter type is duplicated.
 
-        :param str foo: {SOME_TEXT}
-        :type str
+    Parameters:
+        docstring: A parametrized docstring.
+        annotation: A parametrized annotation for the parent parameter.
     """
-
-    _, warnings = parse(
-        docstring,
-        parent=Function("func", parameters=Parameters(Parameter("foo", annotation="str", kind=None))),
-    )
-    assert "Failed to get ':directive: value' pair from" in warnings[0]
-
-
-def test_parse__param_type_no_name__error_message():
-    """Parse a simple docstring."""
-    docstring = f"""
-        Docstring with line continuation.
-
-        :param str foo: {SOME_TEXT}
-        :type: str
-        """
-
     _, warnings = parse(
         docstring,
-        parent=Function("func", parameters=Parameters(Parameter("foo", annotation="str", kind=None))),
+        parent=Function("func", parameters=Parameters(Parameter("foo", annotation=annotation, kind=None))),
     )
-    assert "Failed to get parameter name from" in warnings[0]
-
-
-@pytest.mark.parametrize(
-    "docstring",
-    [
-        f"""
-        Docstring with param with continuation, no indent.
+    assert warnings[0] is DocstringWarningCode.duplicate_parameter_information
 
-        :var {SOME_NAME}: {SOME_TEXT}
-        {SOME_EXTRA_TEXT}
-        """,
-        f"""
-        Docstring with param with continuation, with indent.
 
-        :var {SOME_NAME}: {SOME_TEXT}
-          {SOME_EXTRA_TEXT}
-        """,
-    ],
-)
+@pytest.mark.parametrize("docstring", [_VAR_CONT_NO_INDENT, _VAR_CONT_INDENT])
 def test_parse__attribute_field_multi_line__param_section(docstring):
     """Parse multiline attributes.
 
@@ -469,378 +590,250 @@ def test_parse__attribute_field_multi_line__param_section(docstring):
     sections, warnings = parse(docstring)
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.attributes
-    assert_attribute_equal(
-        sections[1].value[0],
-        DocstringAttribute(SOME_NAME, description=f"{SOME_TEXT} {SOME_EXTRA_TEXT}"),
-    )
+    assert sections[1].value[0] == cached_attribute(SOME_NAME, description=f"{SOME_TEXT} {SOME_EXTRA_TEXT}")
     assert not warnings
 
 
-@pytest.mark.parametrize(
-    "attribute_directive_name",
-    [
-        "var",
-        "ivar",
-        "cvar",
-    ],
-)
+@pytest.mark.parametrize("attribute_directive_name", list(_ATTRIBUTE_DIRECTIVE_DOCSTRINGS))
 def test_parse__all_attribute_names__param_section(attribute_directive_name):
     """Parse all attributes directives.
 
     Parameters:
         attribute_directive_name: A parametrized directive name.
     """
-    sections, warnings = parse(
-        f"""
-        Docstring with one line attribute.
-
-        :{attribute_directive_name} {SOME_NAME}: {SOME_TEXT}
-        """
-    )
+    sections, warnings = parse(_ATTRIBUTE_DIRECTIVE_DOCSTRINGS[attribute_directive_name])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.attributes
-    assert_attribute_equal(
-        sections[1].value[0],
-        DocstringAttribute(SOME_NAME, description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_attribute(SOME_NAME, description=SOME_TEXT)
     assert not warnings
 
 
-def test_parse__class_attributes__attributes_section():
-    """Parse class attributes."""
-    docstring = f"""
-        Class docstring with attributes
+def test_parse__class_attributes__attributes_section(templates):
+    """Parse class attributes.
 
-        :var foo: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring, parent=Class("klass"))
+    sections, _ = parse(templates["class_attributes"], parent=Class("klass"))
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.attributes
-    assert_attribute_equal(
-        sections[1].value[0],
-        DocstringAttribute(SOME_NAME, description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_attribute(SOME_NAME, description=SOME_TEXT)
 
 
-def test_parse__class_attributes_with_type__annotation_in_attributes_section():
-    """Parse typed class attributes."""
-    docstring = f"""
-        Class docstring with attributes
+def test_parse__class_attributes_with_type__annotation_in_attributes_section(templates):
+    """Parse typed class attributes.
 
-        :vartype foo: str
-        :var foo: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring, parent=Class("klass"))
+    sections, _ = parse(templates["class_attributes_typed"], parent=Class("klass"))
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.attributes
-    assert_attribute_equal(
-        sections[1].value[0],
-        DocstringAttribute(SOME_NAME, annotation="str", description=SOME_TEXT),
-    )
-
-
-def test_parse__attribute_invalid_directive___error():
-    """Warn on invalid attribute directive."""
-    docstring = f"""
-        Class docstring with attributes
+    assert sections[1].value[0] == cached_attribute(SOME_NAME, annotation="str", description=SOME_TEXT)
 
-        :var {SOME_TEXT}
-    """
 
-    _, warnings = parse(docstring)
-    assert "Failed to get ':directive: value' pair from" in warnings[0]
-
-
-def test_parse__attribute_no_name__error():
-    """Warn on invalid attribute directive."""
-    docstring = f"""
-        Class docstring with attributes
+def test_parse__return_directive__return_section_no_type(templates):
+    """Parse return directives.
 
-        :var: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    _, warnings = parse(docstring)
-    assert "Failed to parse field directive from" in warnings[0]
-
-
-def test_parse__attribute_duplicate__error():
-    """Warn on duplicate attribute directive."""
-    docstring = f"""
-        Class docstring with attributes
-
-        :var foo: {SOME_TEXT}
-        :var foo: {SOME_TEXT}
-        """
-
-    _, warnings = parse(docstring)
-    assert "Duplicate attribute entry for 'foo'" in warnings[0]
-
-
-def test_parse__class_attributes_type_invalid__error():
-    """Warn on invalid attribute type directive."""
-    docstring = f"""
-        Class docstring with attributes
-
-        :vartype str
-        :var foo: {SOME_TEXT}
-        """
-
-    _, warnings = parse(docstring)
-    assert "Failed to get ':directive: value' pair from " in warnings[0]
-
-
-def test_parse__class_attributes_type_no_name__error():
-    """Warn on invalid attribute directive."""
-    docstring = f"""
-        Class docstring with attributes
-
-        :vartype: str
-        :var foo: {SOME_TEXT}
-        """
-
-    _, warnings = parse(docstring)
-    assert "Failed to get attribute name from" in warnings[0]
+    sections, _ = parse(templates["return"])
+    assert len(sections) == 2
+    assert sections[1].kind is DocstringSectionKind.returns
+    assert sections[1].value[0] == cached_return(name="", annotation=None, description=SOME_TEXT)
 
 
-def test_parse__return_directive__return_section_no_type():
-    """Parse return directives."""
-    docstring = f"""
-        Function with only return directive
+def test_parse__return_directive_rtype__return_section_with_type(templates):
+    """Parse typed return directives.
 
-        :return: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["return_rtype"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.returns
-    assert_element_equal(
-        sections[1].value[0],
-        DocstringReturn(name="", annotation=None, description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_return(name="", annotation="str", description=SOME_TEXT)
 
 
-def test_parse__return_directive_rtype__return_section_with_type():
-    """Parse typed return directives."""
-    docstring = f"""
-        Function with only return & rtype directive
+def test_parse__return_directive_rtype_first__return_section_with_type(templates):
+    """Parse typed-first return directives.
 
-        :return: {SOME_TEXT}
-        :rtype: str
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["rtype_first"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.returns
-    assert_element_equal(
-        sections[1].value[0],
-        DocstringReturn(name="", annotation="str", description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_return(name="", annotation="str", description=SOME_TEXT)
 
 
-def test_parse__return_directive_rtype_first__return_section_with_type():
-    """Parse typed-first return directives."""
-    docstring = f"""
-        Function with only return & rtype directive
+def test_parse__return_directive_annotation__return_section_with_type(templates):
+    """Parse return directives with return annotation.
 
-        :rtype: str
-        :return: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["return_annotated"], parent=Function("func", returns="str"))
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.returns
-    assert_element_equal(
-        sections[1].value[0],
-        DocstringReturn(name="", annotation="str", description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_return(name="", annotation="str", description=SOME_TEXT)
 
 
-def test_parse__return_directive_annotation__return_section_with_type():
-    """Parse return directives with return annotation."""
-    docstring = f"""
-        Function with return directive, rtype directive, & annotation
+def test_parse__return_directive_annotation__prefer_return_directive(templates):
+    """Prefer docstring type over return annotation.
 
-        :return: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring, parent=Function("func", returns="str"))
+    sections, _ = parse(templates["return_annotated_rtype"], parent=Function("func", returns="int"))
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.returns
-    assert_element_equal(
-        sections[1].value[0],
-        DocstringReturn(name="", annotation="str", description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_return(name="", annotation="str", description=SOME_TEXT)
 
 
-def test_parse__return_directive_annotation__prefer_return_directive():
-    """Prefer docstring type over return annotation."""
-    docstring = f"""
-        Function with return directive, rtype directive, & annotation
+@pytest.mark.parametrize(
+    "docstring,expected_warning",
+    [
+        (
+            f"""
+        Class docstring with attributes
 
-        :return: {SOME_TEXT}
-        :rtype: str
-    """
+        :var {SOME_TEXT}
+    """,
+            DocstringWarningCode.invalid_directive,
+        ),
+        (
+            f"""
+        Class docstring with attributes
 
-    sections, _ = parse(docstring, parent=Function("func", returns="int"))
-    assert len(sections) == 2
-    assert sections[1].kind is DocstringSectionKind.returns
-    assert_element_equal(
-        sections[1].value[0],
-        DocstringReturn(name="", annotation="str", description=SOME_TEXT),
-    )
+        :var: {SOME_TEXT}
+    """,
+            DocstringWarningCode.invalid_field_directive,
+        ),
+        (
+            f"""
+        Class docstring with attributes
 
+        :vartype str
+        :var foo: {SOME_TEXT}
+        """,
+            DocstringWarningCode.invalid_directive,
+        ),
+        (
+            f"""
+        Class docstring with attributes
 
-def test_parse__return_invalid__error():
-    """Warn on invalid return directive."""
-    docstring = f"""
+        :vartype: str
+        :var foo: {SOME_TEXT}
+        """,
+            DocstringWarningCode.no_attribute_name,
+        ),
+        (
+            f"""
         Function with only return directive
 
         :return {SOME_TEXT}
-    """
-
-    _, warnings = parse(docstring)
-    assert "Failed to get ':directive: value' pair from " in warnings[0]
+    """,
+            DocstringWarningCode.invalid_directive,
+        ),
+        (
+            """
+        Function with only return directive
 
+        :rtype str
+    """,
+            DocstringWarningCode.invalid_directive,
+        ),
+        (
+            f"""
+        Function with only return directive
 
-def test_parse__rtype_invalid__error():
-    """Warn on invalid typed return directive."""
-    docstring = """
+        :raise {SOME_TEXT}
+    """,
+            DocstringWarningCode.invalid_directive,
+        ),
+        (
+            f"""
         Function with only return directive
 
-        :rtype str
-    """
+        :raise: {SOME_TEXT}
+    """,
+            DocstringWarningCode.invalid_exception_directive,
+        ),
+    ],
+    ids=[
+        "attribute_invalid_directive",
+        "attribute_no_name",
+        "attribute_type_invalid",
+        "attribute_type_no_name",
+        "return_invalid",
+        "rtype_invalid",
+        "raise_invalid",
+        "raise_no_name",
+    ],
+)
+def test_parse__invalid_directive__error(docstring, expected_warning):
+    """Warn on invalid or incomplete directives.
 
+    Parameters:
+        docstring: A parametrized docstring.
+        expected_warning: A parametrized expected warning message.
+    """
     _, warnings = parse(docstring)
-    assert "Failed to get ':directive: value' pair from " in warnings[0]
+    assert warnings[0] is expected_warning
 
 
-def test_parse__raises_directive__exception_section():
-    """Parse raise directives."""
-    docstring = f"""
-        Function with only return directive
+def test_parse__raises_directive__exception_section(templates):
+    """Parse raise directives.
 
-        :raise SomeException: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["raise_only"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.raises
-    assert_element_equal(
-        sections[1].value[0],
-        DocstringRaise(annotation=SOME_EXCEPTION_NAME, description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_raise(annotation=SOME_EXCEPTION_NAME, description=SOME_TEXT)
 
 
-def test_parse__multiple_raises_directive__exception_section_with_two():
-    """Parse multiple raise directives."""
-    docstring = f"""
-        Function with only return directive
+def test_parse__multiple_raises_directive__exception_section_with_two(templates):
+    """Parse multiple raise directives.
 
-        :raise SomeException: {SOME_TEXT}
-        :raise SomeOtherException: {SOME_TEXT}
+    Parameters:
+        templates: The docstring templates.
     """
-
-    sections, _ = parse(docstring)
+    sections, _ = parse(templates["raise_multiple"])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.raises
-    assert_element_equal(
-        sections[1].value[0],
-        DocstringRaise(annotation=SOME_EXCEPTION_NAME, description=SOME_TEXT),
-    )
-    assert_element_equal(
-        sections[1].value[1],
-        DocstringRaise(annotation=SOME_OTHER_EXCEPTION_NAME, description=SOME_TEXT),
-    )
+    assert sections[1].value[0] == cached_raise(annotation=SOME_EXCEPTION_NAME, description=SOME_TEXT)
+    assert sections[1].value[1] == cached_raise(annotation=SOME_OTHER_EXCEPTION_NAME, description=SOME_TEXT)
 
 
-@pytest.mark.parametrize(
-    "raise_directive_name",
-    [
-        "raises",
-        "raise",
-        "except",
-        "exception",
-    ],
-)
+@pytest.mark.parametrize("raise_directive_name", list(_RAISE_DIRECTIVE_DOCSTRINGS), indirect=True)
 def test_parse__all_exception_names__param_section(raise_directive_name):
     """Parse all raise directives.
 
     Parameters:
         raise_directive_name: A parametrized directive name.
     """
-    sections, _ = parse(
-        f"""
-        Docstring with one line attribute.
-
-        :{raise_directive_name} {SOME_EXCEPTION_NAME}: {SOME_TEXT}
-        """
-    )
+    sections, _ = parse(_RAISE_DIRECTIVE_DOCSTRINGS[raise_directive_name])
     assert len(sections) == 2
     assert sections[1].kind is DocstringSectionKind.raises
-    assert_element_equal(
-        sections[1].value[0],
-        DocstringRaise(annotation=SOME_EXCEPTION_NAME, description=SOME_TEXT),
-    )
-
-
-def test_parse__raise_invalid__error():
-    """Warn on invalid raise directives."""
-    docstring = f"""
-        Function with only return directive
+    assert sections[1].value[0] == cached_raise(annotation=SOME_EXCEPTION_NAME, description=SOME_TEXT)
 
-        :raise {SOME_TEXT}
-    """
 
-    _, warnings = parse(docstring)
-    assert "Failed to get ':directive: value' pair from " in warnings[0]
-
-
-def test_parse__raise_no_name__error():
-    """Warn on invalid raise directives."""
-    docstring = f"""
-        Function with only return directive
+def test_parse_module_attributes_section__expected_attributes_section(templates):
+    """Parse attributes section in modules.
 
-        :raise: {SOME_TEXT}
-    """
-
-    _, warnings = parse(docstring)
-    assert "Failed to parse exception directive from" in warnings[0]
-
-
-def test_parse_module_attributes_section__expected_attributes_section():
-    """Parse attributes section in modules."""
-    docstring = """
-        Let's describe some attributes.
-
-        :var A: Alpha.
-        :vartype B: bytes
-        :var B: Beta.
-        :var C: Gamma.
-        :var D: Delta.
-        :var E: Epsilon.
-        :vartype E: float
+    Parameters:
+        templates: The docstring templates.
     """
-
     module = Module("mod", filepath=None)
-    module["A"] = Attribute("A", annotation="int", value="0")
-    module["B"] = Attribute("B", annotation="str", value=repr("ŧ"))
-    module["C"] = Attribute("C", annotation="bool", value="True")
-    module["D"] = Attribute("D", annotation=None, value="3.0")
-    module["E"] = Attribute("E", annotation=None, value="None")
-    sections, warnings = parse(docstring, parent=module)
+    for name, annotation, value in _MODULE_ATTRIBUTES:
+        module[name] = Attribute(name, annotation=annotation, value=value)
+    sections, warnings = parse(templates["module_attributes"], parent=module)
 
     attr_section = sections[1]
     assert attr_section.kind is DocstringSectionKind.attributes
-    assert len(attr_section.value) == 5
-    expected_kwargs = [
-        {"name": "A", "annotation": "int", "description": "Alpha."},
-        {"name": "B", "annotation": "bytes", "description": "Beta."},
-        {"name": "C", "annotation": "bool", "description": "Gamma."},
-        {"name": "D", "annotation": None, "description": "Delta."},
-        {"name": "E", "annotation": "float", "description": "Epsilon."},
-    ]
-    for index, expected in enumerate(expected_kwargs):
-        assert_attribute_equal(attr_section.value[index], DocstringAttribute(**expected))
+    assert attr_section.value == _EXPECTED_MODULE_ATTRIBUTES
     assert not warnings